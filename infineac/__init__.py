@@ -18,5 +18,16 @@ __all__ = [
     "topic_extractor",
 ]
 
-if __name__ == "__main__":
-    print("This is a package, not a script.")
+
+def __getattr__(name):
+    """
+    Imports the submodules listed in `__all__` on first access, so that
+    ``import infineac`` does not load spaCy, BERTopic etc. until needed.
+    """
+    if name in __all__:
+        import importlib
+
+        module = importlib.import_module(f"infineac.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
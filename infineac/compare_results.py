@@ -4,11 +4,42 @@ Compare the results of the different models created by the
 """
 
 import itertools
+from functools import reduce
 
 import polars as pl
 
 import infineac.constants as constants
-import infineac.helper as helper
+
+# cartesian product of categories and strategies, see create_empty_count_df
+_EMPTY_COUNT_DF = pl.DataFrame(
+    list(
+        itertools.product(
+            list(constants.CATEGORIES_TOPICS.keys()),
+            list(constants.STRATEGY_KEYWORDS.keys()) + ["no strategy"],
+        )
+    ),
+    orient="row",
+).rename({"column_0": "category", "column_1": "strategy"})
+
+# fixed output columns of calculate_similarity around the topic/category ones
+_SIMILARITY_COLUMNS_PREFIX = (
+    "company_name",
+    "year",
+    "russia_count",
+    "ukraine_count",
+    "sanction_count",
+    "exit_strategy",
+    "stay_strategy",
+    "adaptation_strategy",
+)
+_SIMILARITY_COLUMNS_SUFFIX = (
+    "category_intersection",
+    "category_union",
+    "jaccard_topic_pairwise",
+    "jaccard_category_pairwise",
+    "jaccard_topic_combined",
+    "jaccard_category_combined",
+)
 
 
 def create_compare_df(dfs, suffixes):
@@ -27,22 +58,26 @@ def create_compare_df(dfs, suffixes):
     if len(dfs) == 1:
         return dfs[0]
     else:
-        df = dfs[0]
-        for i in range(1, len(dfs)):
-            df = df.join(
-                dfs[i].select(["company_name", "year", "topic", "category"]),
-                on=["company_name", "year"],
-                how="left",
-                suffix=suffixes[i],
+        renamed = [
+            df.lazy()
+            .select(
+                pl.all() if i == 0 else ["company_name", "year", "topic", "category"]
             )
-        df = df.rename(
-            {"topic": "topic" + suffixes[0], "category": "category" + suffixes[0]}
-        )
+            .rename({"topic": "topic" + suffix, "category": "category" + suffix})
+            for i, (df, suffix) in enumerate(zip(dfs, suffixes))
+        ]
 
-        return df
+        return reduce(
+            lambda left, right: left.join(
+                right, on=["company_name", "year"], how="left"
+            ),
+            renamed,
+        ).collect()
 
 
-def calculate_similarity(df: pl.DataFrame):
+def calculate_similarity(
+    df: pl.DataFrame | pl.LazyFrame,
+) -> pl.DataFrame | pl.LazyFrame:
     """
     Calculates the intersection and union of all the given categories and
     topics and, based on this, the similarity within the categories and topics.
@@ -52,13 +87,16 @@ def calculate_similarity(df: pl.DataFrame):
 
     Parameters
     ----------
-    df : (pl.DataFrame)
-        The input DataFrame containing topic and category columns.
+    df : (pl.DataFrame | pl.LazyFrame)
+        The input DataFrame containing topic and category columns. If a
+        LazyFrame is given, the calculation is only planned and the caller
+        has to `collect` the result.
 
     Returns
     -------
-    pl.DataFrame
-        The DataFrame with calculated similarity measures.
+    pl.DataFrame | pl.LazyFrame
+        The DataFrame with calculated similarity measures. Of the same type
+        as the input `df`.
 
 
     Raises
@@ -93,8 +131,13 @@ def calculate_similarity(df: pl.DataFrame):
     ----------
     .. [1] https://en.wikipedia.org/wiki/Jaccard_index
     """
-    topic_names = [name for name in df.columns if name.startswith("topic")]
-    category_names = [name for name in df.columns if name.startswith("category")]
+    topic_names = []
+    category_names = []
+    for name in df.columns:
+        if name.startswith("topic"):
+            topic_names.append(name)
+        elif name.startswith("category"):
+            category_names.append(name)
 
     if len(topic_names) == 0:
         raise ValueError("No topic columns found.")
@@ -109,104 +152,96 @@ def calculate_similarity(df: pl.DataFrame):
     if len(category_names) == 1:
         raise ValueError("Only one category column found.")
 
-    df = df.with_columns(
-        topic_intersection=pl.col(topic_names[0]).list.set_intersection(topic_names[1]),
-        topic_union=pl.col(topic_names[0]).list.set_union(topic_names[1]),
-        category_intersection=pl.col(category_names[0]).list.set_intersection(
-            category_names[1]
-        ),
-        category_union=pl.col(category_names[0]).list.set_union(category_names[1]),
-    )
+    jaccard_similarity_pairwise_topics = [
+        pl.col(name_1).list.set_intersection(pl.col(name_2)).list.len()
+        / pl.col(name_1).list.set_union(pl.col(name_2)).list.len().clip(lower_bound=1)
+        for name_1, name_2 in itertools.combinations(topic_names, 2)
+    ]
+    jaccard_similarity_pairwise_categories = [
+        pl.col(name_1).list.set_intersection(pl.col(name_2)).list.len()
+        / pl.col(name_1).list.set_union(pl.col(name_2)).list.len().clip(lower_bound=1)
+        for name_1, name_2 in itertools.combinations(category_names, 2)
+    ]
 
-    for i in range(1, len(topic_names)):
-        df = df.with_columns(
-            topic_intersection=pl.col("topic_intersection").list.set_intersection(
-                topic_names[i]
+    lst_select = [
+        *_SIMILARITY_COLUMNS_PREFIX,
+        *topic_names,
+        "topic_intersection",
+        "topic_union",
+        *category_names,
+        *_SIMILARITY_COLUMNS_SUFFIX,
+    ]
+
+    similarity = (
+        df.lazy()
+        .with_columns(
+            topic_intersection=reduce(
+                lambda expr, name: expr.list.set_intersection(pl.col(name)),
+                topic_names[1:],
+                pl.col(topic_names[0]),
             ),
-            topic_union=pl.col("topic_union").list.set_union(topic_names[i]),
-            category_intersection=pl.col("category_intersection").list.set_intersection(
-                category_names[i]
+            topic_union=reduce(
+                lambda expr, name: expr.list.set_union(pl.col(name)),
+                topic_names[1:],
+                pl.col(topic_names[0]),
+            ),
+            category_intersection=reduce(
+                lambda expr, name: expr.list.set_intersection(pl.col(name)),
+                category_names[1:],
+                pl.col(category_names[0]),
+            ),
+            category_union=reduce(
+                lambda expr, name: expr.list.set_union(pl.col(name)),
+                category_names[1:],
+                pl.col(category_names[0]),
             ),
-            category_union=pl.col("category_union").list.set_union(category_names[i]),
-        )
-
-    df = df.with_columns(
-        pl.when(pl.col("topic_union").list.len() == 0)
-        .then(pl.lit(0))
-        .otherwise(
-            pl.col("topic_intersection").list.len() / pl.col("topic_union").list.len()
-        )
-        .alias("jaccard_topic_combined"),
-        pl.when(pl.col("category_union").list.len() == 0)
-        .then(pl.lit(0))
-        .otherwise(
-            pl.col("category_intersection").list.len()
-            / pl.col("category_union").list.len()
-        )
-        .alias("jaccard_category_combined"),
-    )
-
-    jaccard_similarity_pairwise_topics = helper.jaccard_similarity_pairwise(
-        topic_names, df
-    )
-    jaccard_similarity_pairwise_categories = helper.jaccard_similarity_pairwise(
-        category_names, df
-    )
-
-    df = df.with_columns(
-        pl.Series(
-            name="jaccard_topic_pairwise", values=jaccard_similarity_pairwise_topics
         )
-    )
-    df = df.with_columns(
-        pl.Series(
-            name="jaccard_category_pairwise",
-            values=jaccard_similarity_pairwise_categories,
+        .with_columns(
+            (
+                pl.col("topic_intersection").list.len()
+                / pl.col("topic_union").list.len().clip(lower_bound=1)
+            ).alias("jaccard_topic_combined"),
+            (
+                pl.col("category_intersection").list.len()
+                / pl.col("category_union").list.len().clip(lower_bound=1)
+            ).alias("jaccard_category_combined"),
+            (
+                pl.sum_horizontal(jaccard_similarity_pairwise_topics)
+                / len(jaccard_similarity_pairwise_topics)
+            ).alias("jaccard_topic_pairwise"),
+            (
+                pl.sum_horizontal(jaccard_similarity_pairwise_categories)
+                / len(jaccard_similarity_pairwise_categories)
+            ).alias("jaccard_category_pairwise"),
         )
-    )
-    lst_select = (
-        [
-            "company_name",
-            "year",
-            "russia_count",
-            "ukraine_count",
-            "sanction_count",
-            "exit_strategy",
-            "stay_strategy",
-            "adaptation_strategy",
-        ]
-        + topic_names
-        + ["topic_intersection", "topic_union"]
-        + category_names
-        + [
-            "category_intersection",
-            "category_union",
-            "jaccard_topic_pairwise",
-            "jaccard_category_pairwise",
-            "jaccard_topic_combined",
-            "jaccard_category_combined",
-        ]
+        .select(lst_select)
     )
 
-    return df.select(lst_select)
+    if isinstance(df, pl.LazyFrame):
+        return similarity
+    return similarity.collect()
 
 
-def get_strategy_list(dictionary: dict) -> list[list[str]]:
+def get_strategy_list(df: pl.DataFrame) -> pl.Series:
     """
-    Returns a list of lists with the strategies for each row of the given
-    `dict`.
+    Returns a Series of lists with the strategies (`exit`, `adaptation` and
+    `stay`) for each row of the given DataFrame `df`. A strategy is included
+    if its count column is greater than zero.
     """
-    strategy_list = []
-    for i in range(len(dictionary[list(dictionary.keys())[0]])):
-        lst_ = []
-        if dictionary["exit_strategy"][i] > 0:
-            lst_.append("exit")
-        if dictionary["adaptation_strategy"][i] > 0:
-            lst_.append("adaptation")
-        if dictionary["stay_strategy"][i] > 0:
-            lst_.append("stay")
-        strategy_list.append(lst_)
-    return strategy_list
+    return df.select(
+        pl.concat_list(
+            [
+                pl.when(pl.col(column) > 0).then(pl.lit(strategy)).otherwise(None)
+                for column, strategy in [
+                    ("exit_strategy", "exit"),
+                    ("adaptation_strategy", "adaptation"),
+                    ("stay_strategy", "stay"),
+                ]
+            ]
+        )
+        .list.drop_nulls()
+        .alias("strategies")
+    )["strategies"]
 
 
 def create_empty_count_df(
@@ -217,51 +252,8 @@ def create_empty_count_df(
     the strategies with the columns `category`, `strategy` as well as the given
     `column_names`.
     """
-    count = pl.DataFrame(
-        list(
-            itertools.product(
-                list(constants.CATEGORIES_TOPICS.keys()),
-                list(constants.STRATEGY_KEYWORDS.keys()) + ["no strategy"],
-            )
-        ),
-        orient="row",
-    ).rename({"column_0": "category", "column_1": "strategy"})
-
-    for column in column_names:
-        count = count.with_columns(**{column: 0})
-
-    return count
-
-
-def update_count(
-    count: pl.DataFrame, categories: list[str], strategies: list[str], column: str
-) -> pl.DataFrame:
-    """
-    Updates the given `count` DataFrame for the combination of the given
-    `categories` and `strategies` in the given `column`.
-    """
-    if len(categories) == 0:
-        return count
-    if len(strategies) == 0:
-        return count.with_columns(
-            **{
-                column: pl.when(
-                    pl.col("category").is_in(categories)
-                    & (pl.col("strategy") == "no strategy")
-                )
-                .then(pl.col(column) + 1)
-                .otherwise(pl.col(column))
-            }
-        )
-    return count.with_columns(
-        **{
-            column: pl.when(
-                (pl.col("category").is_in(categories))
-                & (pl.col("strategy").is_in(strategies))
-            )
-            .then(pl.col(column) + 1)
-            .otherwise(pl.col(column))
-        }
+    return _EMPTY_COUNT_DF.with_columns(
+        **{column: pl.lit(0, dtype=pl.UInt32) for column in column_names}
     )
 
 
@@ -274,22 +266,27 @@ def aggregate_results(
     counts the number of times a category and a strategy appear together. The
     categories are given by the `category_names`.
     """
-    select_columns = ["category_" + name for name in category_names] + [
-        "exit_strategy",
-        "adaptation_strategy",
-        "stay_strategy",
-    ]
-
-    df_dict = df.select(select_columns).to_dict(as_series=False)
-
-    strategy_list = get_strategy_list(df_dict)
-    count = create_empty_count_df()
+    df = df.with_columns(get_strategy_list(df))
+    count = create_empty_count_df(column_names=[])
 
     for column in category_names:
-        for i, categories in enumerate(df_dict["category_" + column]):
-            strategies = strategy_list[i]
-            if len(categories) == 0:
-                continue
-            count = update_count(count, categories, strategies, column)
+        column_count = (
+            df.lazy()
+            .select(
+                # a category counts once per row, even if listed repeatedly
+                pl.col("category_" + column).list.unique().alias("category"),
+                pl.col("strategies").alias("strategy"),
+            )
+            .explode("category")
+            .explode("strategy")
+            .filter(pl.col("category").is_not_null())
+            .with_columns(pl.col("strategy").fill_null("no strategy"))
+            .group_by(["category", "strategy"])
+            .agg(pl.count().cast(pl.UInt32).alias(column))
+            .collect(streaming=True)
+        )
+        count = count.join(
+            column_count, on=["category", "strategy"], how="left"
+        ).with_columns(pl.col(column).fill_null(0))
 
     return count
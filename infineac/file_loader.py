@@ -18,15 +18,22 @@ Notes
     relevant information and stores it in a list of dictionaries.
 """
 
+import functools
+import itertools
 import logging
+import logging.handlers
+import multiprocessing
 import os
 import re
+import sys
 import warnings
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from lxml import etree
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from tqdm import tqdm
 
 # main directory
@@ -65,6 +72,109 @@ load_warnings_handler.setFormatter(formatter)
 load_logger.addHandler(load_handler)
 load_warnings_logger.addHandler(load_warnings_handler)
 
+# Regular expressions used to parse the earnings calls
+# participant line, e.g. "John Doe,  Company - CEO  [2]"
+_PARTICIPANT_RE = re.compile(r".+  \[\d+\]", re.DOTALL)
+# name and number of appearance of a participant line
+_PARTICIPANT_NAME_RE = re.compile(r"(.*)\s{2,}\[(\d+)\]$")
+# separator between participants in the participants sections
+_PARTICIPANTS_SPLIT_RE = re.compile(r"\s{1,}\*")
+_MULTIPLE_WHITESPACE_RE = re.compile(r"\s{2,}")
+_LEADING_NON_LETTERS_RE = re.compile(r"^[^A-Za-z]*")
+
+# headers of the parts of an earnings call, each part ends with _SECTION_END
+_SECTION_HEADERS = {
+    "corp_participants": "Corporate Participants\r\n" + "=" * 80 + "\r\n",
+    "conf_participants": "Conference Call Participants\r\n" + "=" * 80 + "\r\n",
+    "presentation": "Presentation\r\n" + "-" * 80,
+    # some earnings calls have a "Transcript" instead of a "Presentation" part
+    "transcript": "Transcript\r\n" + "-" * 80,
+    "qa": "Questions and Answers\r\n" + "-" * 80,
+}
+_SECTION_END = "=" * 80
+# separator between the participants and texts of a part
+_PART_SEPARATOR = "-" * 80 + "\r\n"
+
+# names of the generic participants as they appear in the earnings calls
+_GENERIC_PARTICIPANTS = {
+    "editor",
+    "operator",
+    "moderator",
+    "Editor",
+    "Operator",
+    "Moderator",
+}
+
+# positions of the generic participants, keyed by their lower case name
+_GENERIC_POSITIONS = {
+    "operator": "operator",
+    "editor": "operator",
+    "moderator": "operator",
+}
+
+# month and weekday names and time zones of the dates in the xml files
+_MONTHS = {
+    month: i
+    for i, month in enumerate(
+        [
+            "January",
+            "February",
+            "March",
+            "April",
+            "May",
+            "June",
+            "July",
+            "August",
+            "September",
+            "October",
+            "November",
+            "December",
+        ],
+        start=1,
+    )
+}
+_MONTHS_ABBR = {month[:3]: i for month, i in _MONTHS.items()}
+_WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+_TIMEZONES = ("GMT", "UTC")
+
+# template of the event returned by create_blank_event
+_BLANK_EVENT = {
+    "file": "",
+    "year_upload": "",
+    "corp_participants": [],
+    "corp_participants_collapsed": [],
+    "conf_participants": [],
+    "conf_participants_collapsed": [],
+    "presentation": [],
+    "presentation_collapsed": "",
+    "qa": [],
+    "qa_collapsed": "",
+    "action": "unknown",
+    "story_type": "unknown",
+    "version": "unknown",
+    "title": "unknown",
+    "city": "unknown",
+    "company_name": "unknown",
+    "company_ticker": "unknown",
+    "date": datetime(1900, 1, 1),
+    "id": -1,
+    "last_update": datetime(1900, 1, 1),
+    "event_type_id": -1,
+    "event_type_name": "unknown",
+}
+# keys of the template, whose (mutable) lists are created anew for every event
+_BLANK_EVENT_LISTS = tuple(
+    key for key, value in _BLANK_EVENT.items() if isinstance(value, list)
+)
+
 
 def structure_earnings_call(string: str) -> dict:
     """
@@ -100,109 +210,55 @@ def structure_earnings_call(string: str) -> dict:
         '*').
     """
 
-    start_word_corp_participants = (
-        "Corporate Participants\r\n========================"
-        "========================================================\r\n"
-    )
-    end_word_corp_participants = (
-        "========================================"
-        "========================================"
-    )
-
-    start_word_conf_participants = (
-        "Conference Call Participants\r\n==================="
-        "=============================================================\r\n"
-    )
-    end_word_conf_participants = (
-        "========================================"
-        "========================================"
-    )
-
-    # es kann auch der Fall sein, dass anstatt von Presentation "Transcript" steht
-    start_word_presentation = (
-        "Presentation\r\n------------------------"
-        "--------------------------------------------------------"
-    )
-    end_word_presentation = (
-        "========================================"
-        "========================================"
-    )
-    start_word_transcript = (
-        "Transcript\r\n--------------------------"
-        "------------------------------------------------------"
-    )
-
-    start_word_qa = (
-        "Questions and Answers\r\n---------------"
-        "-----------------------------------------------------------------"
-    )
-    end_word_qa = (
-        "========================================"
-        "========================================"
-    )
-
     string = string.replace("&amp;", "&")  # replace html ampersand
 
-    if start_word_corp_participants in string:
-        start_index_corp_participants = string.find(start_word_corp_participants) + len(
-            start_word_corp_participants
-        )
-        end_index_corp_participants = string.find(
-            end_word_corp_participants, start_index_corp_participants
-        )
-        corp_participants = string[
-            start_index_corp_participants:end_index_corp_participants
-        ]
-    else:
-        corp_participants = ""
+    output = {}
+    for section in ["corp_participants", "conf_participants", "presentation", "qa"]:
+        header = _SECTION_HEADERS[section]
+        start = string.find(header)
+        if start == -1 and section == "presentation":
+            header = _SECTION_HEADERS["transcript"]
+            start = string.find(header)
+        if start == -1:
+            output[section] = ""
+            continue
+        start += len(header)
+        end = string.find(_SECTION_END, start)
+        output[section] = string[start:end]
 
-    if start_word_conf_participants in string:
-        start_index_conf_participants = string.find(start_word_conf_participants) + len(
-            start_word_conf_participants
-        )
-        end_index_conf_participants = string.find(
-            end_word_conf_participants, start_index_conf_participants
-        )
-        conf_participants = string[
-            start_index_conf_participants:end_index_conf_participants
-        ]
-    else:
-        conf_participants = ""
+    return output
 
-    if start_word_presentation in string:
-        start_index_presentation = string.find(start_word_presentation) + len(
-            start_word_presentation
-        )
-        end_index_presentation = string.find(
-            end_word_presentation, start_index_presentation
-        )
-        presentation = string[start_index_presentation:end_index_presentation]
-    elif start_word_transcript in string:
-        start_index_presentation = string.find(start_word_transcript) + len(
-            start_word_transcript
-        )
-        end_index_presentation = string.find(
-            end_word_presentation, start_index_presentation
-        )
-        presentation = string[start_index_presentation:end_index_presentation]
-    else:
-        presentation = ""
 
-    if start_word_qa in string:
-        start_index_qa = string.find(start_word_qa) + len(start_word_qa)
-        end_index_qa = string.find(end_word_qa, start_index_qa)
-        qa = string[start_index_qa:end_index_qa]
-    else:
-        qa = ""
+@functools.lru_cache(maxsize=100_000)
+def _match_participant(name: str, participants: tuple[str, ...]) -> str | None:
+    """
+    Returns the listed participant most similar to `name`.
 
-    output = {
-        "corp_participants": corp_participants,
-        "conf_participants": conf_participants,
-        "presentation": presentation,
-        "qa": qa,
-    }
+    Cached, as the same unlisted names (e.g. misspelled analysts) recur with
+    every turn and across the calls of a company.
 
-    return output
+    Parameters
+    ----------
+    name : str
+        Name of the unlisted participant.
+    participants : tuple[str, ...]
+        Listed corporate and conference call participants.
+
+    Returns
+    -------
+    str | None
+        The matching participant or None if no participant is similar enough.
+    """
+    # (ph) is added to some of the participants' names
+    match = process.extractOne(
+        name,
+        [participant.replace("(ph)", "") for participant in participants],
+        scorer=fuzz.ratio,
+        score_cutoff=80,
+    )
+    if match is None:
+        return None
+    return participants[match[2]]
 
 
 def transform_unlisted_participants(
@@ -243,28 +299,31 @@ def transform_unlisted_participants(
     #     participant["name"] = "unknown participant"
     #     return participant
     # some operators / moderators are listed as "operator ..."
-    if participant["name"].lower().startswith("operator"):
+    name_lower = participant["name"].lower()
+    if name_lower.startswith("operator"):
         participant["name"] = "Operator"
         return participant
-    if participant["name"].lower().startswith("moderator"):
+    if name_lower.startswith("moderator"):
         participant["name"] = "Moderator"
         return participant
     # (ph) is added to some of the participants' names
-    participant["name"] = re.sub(r"\s{2,}", "  ", participant["name"])
+    participant["name"] = _MULTIPLE_WHITESPACE_RE.sub("  ", participant["name"])
     # check if a similar name is in the list of participants
-    for participant_ in corp_participants + conf_participants:
-        if fuzz.ratio(participant["name"], participant_.replace("(ph)", "")) >= 80:
-            participant["name"] = participant_
-            return participant
-    participant["name"] = re.sub(r"^[^A-Za-z]*", "", participant["name"])
+    match = _match_participant(
+        participant["name"], tuple(corp_participants + conf_participants)
+    )
+    if match is not None:
+        participant["name"] = match
+        return participant
+    participant["name"] = _LEADING_NON_LETTERS_RE.sub("", participant["name"])
 
     return participant
 
 
 def get_participants_position(
     participant: dict[str, str | int],
-    corp_participants: list[str],
-    conf_participants: list[str],
+    corp_participants: list[str] | set[str],
+    conf_participants: list[str] | set[str],
 ) -> str:
     """
     Returns the position of the participant based on the lists of corporate and
@@ -274,35 +333,46 @@ def get_participants_position(
     ----------
     participant : dict[str, str | int]
         Participant to be transformed. Only uses the key 'name'.
-    corp_participants : list[str]
-        List of corporate participants.
-    conf_participants : list[str]
-        List of conference call participants.
+    corp_participants : list[str] | set[str]
+        Corporate participants. Sets allow for constant time lookups.
+    conf_participants : list[str] | set[str]
+        Conference call participants. Sets allow for constant time lookups.
 
     Returns
     -------
     str
         The position of the participant.
     """
-    if participant["name"].lower() == "operator":
-        return "operator"
-    if participant["name"].lower() == "editor":
-        return "operator"
-    if participant["name"].lower() == "moderator":
-        return "operator"
-    if participant["name"] in corp_participants:
+    name = participant["name"]
+    name_lower = name.lower()
+    if name_lower in _GENERIC_POSITIONS:
+        return _GENERIC_POSITIONS[name_lower]
+    if name in corp_participants:
         return "cooperation"
-    if participant["name"] in conf_participants:
+    if name in conf_participants:
         return "conference"
-    if participant["name"].lower().startswith("unidentified") or participant[
-        "name"
-    ].lower().startswith("unknown"):
+    if name_lower.startswith(("unidentified", "unknown")):
         return "unknown participant"
-    if corp_participants != [] and conf_participants != []:
-        return participant["name"]
+    if corp_participants and conf_participants:
+        return name
     return "unknown participant"
 
 
+def _participant_number(participant: str) -> int | None:
+    """
+    Returns the number of appearance of a `participant`, that is not named and
+    only listed by its number, e.g. '[3]'. Returns None otherwise.
+
+    Same as a regex match of '[digits]' at the start, but with string methods.
+    """
+    if participant[:1] != "[":
+        return None
+    end = participant.find("]")
+    if end > 1 and participant[1:end].isdecimal():
+        return int(participant[1:end])
+    return None
+
+
 def extract_info_from_earnings_call_part(
     part: str,
     corp_participants: list,
@@ -345,36 +415,86 @@ def extract_info_from_earnings_call_part(
             - 'position': str - The participant's position
             - 'text': str - the participant's text
     """
-    # Split presentation into slides
-    split_symbol = (
-        "------------------------------------"
-        "--------------------------------------------\r\n"
+    part_ordered, _ = _extract_info_from_earnings_call_part(
+        part, corp_participants, conf_participants, type
     )
-    parts_split = part.split(split_symbol)
-    parts_split = [part.strip() for part in parts_split]
-    # removes the double spaces between participant and his position
-    # presentation=[re.sub(' +', ' ', el.strip()) for el in presentation if el.strip()]
-
-    # Split part into participants and texts
-    # alternating
-    # participants = []
-    # texts = []
-    # for index, item in enumerate(parts_split):
-    #     if index % 2 == 0:
-    #         participants.append(item)
-    #     else:
-    #         texts.append(item)
-
-    # with regex
-    participants = [
-        part
-        for part in parts_split
-        if re.match(r"(.|\n)+  \[\d+\]", part)
-        or (re.match(r"\[\d+\]", part) and len(part) <= 5)
-    ]
-    texts = [part for part in parts_split if part not in participants]
+    return part_ordered
+
+
+def _split_part(part: str) -> tuple[list[tuple], list[str]]:
+    """
+    Splits a part into its participants and texts, which alternate, in one
+    pass. Each participant is returned as a tuple of its number of appearance,
+    if it is not mentioned by name, and the match of its name and number.
+    """
+    participants_matched = []
+    texts = []
+    for chunk in part.split(_PART_SEPARATOR):
+        chunk = chunk.strip()
+        n = _participant_number(chunk)
+        if n is not None and (len(chunk) <= 5 or _PARTICIPANT_RE.match(chunk)):
+            participants_matched.append((n, None))
+        elif _PARTICIPANT_RE.match(chunk):
+            participants_matched.append((None, _PARTICIPANT_NAME_RE.search(chunk)))
+        else:
+            texts.append(chunk)
+    return participants_matched, texts
 
-    n_participants = len(participants)
+
+def _pad_participants_and_texts(
+    participants_ordered: list[dict], texts: list[str], type: str
+) -> list[str]:
+    """
+    Warns about and evens out participants and texts of different lengths, by
+    extending `participants_ordered` in place with unknown participants or
+    returning `texts` extended with empty strings.
+    """
+    n_participants = len(participants_ordered)
+    n_texts = len(texts)
+    warning_message = (
+        f"{type}_participants ({n_participants}) "
+        f"and {type}_texts ({n_texts}) have different lengths"
+    )
+    load_logger.warning(warning_message)
+    warnings.warn(warning_message)
+
+    # Extend the shorter list with empty strings / unknown participants
+    if n_participants > n_texts:
+        missing = n_participants - n_texts
+        texts = texts + [""] * missing
+        warning_message = f"{type}_texts was extended with empty strings"
+        load_logger.warning(warning_message)
+        warnings.warn(warning_message)
+    if n_participants < n_texts:
+        missing = n_texts - n_participants
+        last_participant = participants_ordered[-1]["n"]
+        for i in range(1, missing + 1):
+            participants_ordered.append(
+                {
+                    "n": last_participant + i,
+                    "name": "unknown participant",
+                    "position": "unknown participant",
+                }
+            )
+        warning_message = f"{type}_participants was extended with unknown participants"
+        load_logger.warning(warning_message)
+        warnings.warn(warning_message)
+    return texts
+
+
+def _extract_info_from_earnings_call_part(
+    part: str,
+    corp_participants: list,
+    conf_participants: list,
+    type: str = "presentation",
+) -> tuple[list[dict] | None, str]:
+    """
+    Does the work of :func:`extract_info_from_earnings_call_part` and also
+    returns the texts of the corporate participants joined into one string,
+    collected in the same pass.
+    """
+    participants_matched, texts = _split_part(part)
+    n_participants = len(participants_matched)
     n_texts = len(texts)
 
     # Note: if no participant or text is found, the presentation is not included
@@ -382,108 +502,107 @@ def extract_info_from_earnings_call_part(
         warning_message = f"No participants present at {type}"
         load_logger.warning(warning_message)
         warnings.warn(warning_message)
-        return None
+        return None, ""
     if n_texts == 0:
         warning_message = f"No texts present at {type}"
         load_logger.warning(warning_message)
         warnings.warn(warning_message)
-        return None
+        return None, ""
 
-    regex_pattern = r"(.*)\s{2,}\[(\d+)\]$"
     participants_ordered = [
-        {
-            "n": int(re.search(regex_pattern, participant).group(2)),
-            "name": re.search(regex_pattern, participant).group(1).strip(),
-        }
-        if not re.match("\[\d+\]", participant)
-        else {
-            "n": int(re.search(r"\[(\d+)\]", participant).group(1)),
-            "name": "unknown participant",
-        }  # if the participant is not mentioned
-        for participant in participants
+        # if the participant is not mentioned
+        {"n": n, "name": "unknown participant"}
+        if n is not None
+        else {"n": int(match.group(2)), "name": match.group(1).strip()}
+        for n, match in participants_matched
     ]
 
-    participants_not_listed = [
-        participant
-        for participant in participants_ordered
-        if participant["name"]
-        not in corp_participants
-        + conf_participants
-        + ["editor", "operator", "moderator"]
-        + ["Editor", "Operator", "Moderator"]
-        and not participant["name"].lower().startswith("unidentified")
-    ]
-
-    # transforms participants_ordered as well
-    for participant in participants_not_listed:
-        participant = transform_unlisted_participants(
-            participant, corp_participants, conf_participants
-        )
+    corp_participants_set = set(corp_participants)
+    conf_participants_set = set(conf_participants)
+    listed_participants = (
+        corp_participants_set | conf_participants_set | _GENERIC_PARTICIPANTS
+    )
 
-    participants_ordered = [
-        {
-            "n": participant["n"],
-            "name": participant["name"],
-            "position": get_participants_position(
+    # names and positions repeat with every turn of a participant, interning
+    # them lets all turns share one string (see _intern_event for events of
+    # other processes)
+    for participant in participants_ordered:
+        name = participant["name"]
+        if name not in listed_participants and not name.lower().startswith(
+            "unidentified"
+        ):
+            # transforms the participant in place
+            transform_unlisted_participants(
                 participant, corp_participants, conf_participants
-            ),
-        }
-        for participant in participants_ordered
-    ]
+            )
+        participant["name"] = sys.intern(participant["name"])
+        participant["position"] = sys.intern(
+            get_participants_position(
+                participant, corp_participants_set, conf_participants_set
+            )
+        )
 
-    if len(participants) != len(texts):
-        warning_message = (
-            f"presentation_participants ({n_participants})"
-            "and presentation_texts ({n_texts}) have different lengths"
+    if n_participants != n_texts:
+        texts = _pad_participants_and_texts(participants_ordered, texts, type)
+
+    part_ordered = []
+    collapsed = []
+    for participant, text in zip(participants_ordered, texts):
+        part_ordered.append(
+            {
+                "n": participant["n"],
+                "name": participant["name"],
+                "position": participant["position"],
+                "text": text,
+            }
         )
-        load_logger.warning(warning_message)
-        warnings.warn(warning_message)
+        if participant["position"] == "cooperation":
+            collapsed.append(text)
+    return part_ordered, " ".join(collapsed)
 
-        # Extend the shorter list with empty strings
-        if n_participants > n_texts:
-            missing = n_participants - n_texts
-            texts = texts + [""] * missing
-            warning_message = "presentation_texts was extended with empty strings"
-            load_logger.warning(warning_message)
-            warnings.warn(warning_message)
-        if n_participants < n_texts:
-            missing = n_texts - n_participants
-            last_participant = participants_ordered[-1]["n"]
-            for i in range(missing):
-                participants.append(
-                    [last_participant + i, "unknown participant", "unknown participant"]
-                )
-            warning_message = (
-                "presentation_participants was extended with unknown participants"
-            )
-            load_logger.warning(warning_message)
-            warnings.warn(warning_message)
-
-    part_ordered = [
-        {
-            "n": participants_ordered[i]["n"],
-            "name": participants_ordered[i]["name"],
-            "position": participants_ordered[i]["position"],
-            "text": texts[i],
-        }
-        for i in range(len(participants))
-    ]
-    return part_ordered
+
+def _split_participants(participants: str):
+    """Yield the blocks between the '  *' markers of a participants string."""
+    start = 0
+    for match in _PARTICIPANTS_SPLIT_RE.finditer(participants):
+        yield participants[start : match.start()]
+        start = match.end()
+    yield participants[start:]
 
 
 def participants_string_to_list(participants: str) -> list[str]:
     """Split the participants string into a list of participants."""
-    participants_list = re.split("\s{1,}\\*", participants)
-
-    participants_list = [
-        [el.strip() for el in pair.split("\r\n") if el.strip()]
-        for pair in participants_list
-        if pair.strip()
-    ]
+    participants_list = []
+    for pair in _split_participants(participants):
+        lines = [line for line in (el.strip() for el in pair.split("\r\n")) if line]
+        if lines:
+            participants_list.append(lines)
 
     return participants_list
 
 
+def parse_participants(
+    participants: str,
+) -> tuple[list[dict[str, str]], list[str]]:
+    """
+    Parses the participants string of an earnings call into a list of
+    dictionaries with the keys `name` and `position` and into a list of
+    collapsed strings of the form `name,  position`.
+    """
+    participants_list = []
+    participants_collapsed = []
+    for participant in _split_participants(participants):
+        if not participant.strip():
+            continue
+        lines = participant.split("\r\n")
+        name = lines[0].strip()
+        position = lines[1].strip() if len(lines) > 1 else "unknown"
+        participants_list.append({"name": name, "position": position})
+        participants_collapsed.append(name + ",  " + position)
+
+    return participants_list, participants_collapsed
+
+
 def participants_list_collapsed(participants_list: list[str]) -> list[str]:
     """Collapse the participants list into a list of strings."""
     return [",  ".join(pair) for pair in participants_list]
@@ -525,74 +644,35 @@ def extract_info_from_earnings_call_structured(
               participants with collapsed name and position.
             - 'presentation': list[dict] - Presentation part of the earnings
               call as returned by :func:`extract_info_from_earnings_call_part`.
+            - 'presentation_collapsed': str - Texts of the corporate
+              participants in the presentation, joined into a single string.
             - 'qa': list[dict] - Q&A part of the earnings call as returned by
               :func:`extract_info_from_earnings_call_part`.
+            - 'qa_collapsed': str - Texts of the corporate participants in
+              the Q&A, joined into a single string.
 
     """
     # Participants
     # is listed with a '  *' at the beginning of each participant
     # Corporation Participants
-    corp_participants = re.split(
-        "\s{1,}\\*", conference_call_structured_dict["corp_participants"]
+    corp_participants, corp_participants_collapsed = parse_participants(
+        conference_call_structured_dict["corp_participants"]
     )
-    corp_participants = [
-        {
-            "name": participant.split("\r\n")[0].strip(),
-            "position": participant.split("\r\n")[1].strip()
-            if len(participant.split("\r\n")) > 1
-            else "unknown",
-        }
-        for participant in corp_participants
-        if participant.strip()
-    ]
-    corp_participants_collapsed = [
-        ",  ".join([participant["name"], participant["position"]])
-        for participant in corp_participants
-    ]
-
-    # corp_participants = [
-    #     [el.strip() for el in pair.split("\r\n") if el.strip()]
-    #     for pair in corp_participants
-    #     if pair.strip()
-    # ]
-    # corp_participants_collapsed = [",  ".join(pair) for pair in corp_participants]
 
     # Conference Call Participants
-    conf_participants = re.split(
-        "\s{1,}\\*", conference_call_structured_dict["conf_participants"]
+    conf_participants, conf_participants_collapsed = parse_participants(
+        conference_call_structured_dict["conf_participants"]
     )
 
-    conf_participants = [
-        {
-            "name": participant.split("\r\n")[0].strip(),
-            "position": participant.split("\r\n")[1].strip()
-            if len(participant.split("\r\n")) > 1
-            else "unknown",
-        }
-        for participant in conf_participants
-        if participant.strip()
-    ]
-    conf_participants_collapsed = [
-        ",  ".join([participant["name"], participant["position"]])
-        for participant in conf_participants
-    ]
-
-    # conf_participants = [
-    #     [el.strip() for el in pair.split("\r\n") if el.strip()]
-    #     for pair in conf_participants
-    #     if pair.strip()
-    # ]
-    # conf_participants_collapsed = [",  ".join(pair) for pair in conf_participants]
-
     # Presentation
-    presentation = extract_info_from_earnings_call_part(
+    presentation, presentation_collapsed = _extract_info_from_earnings_call_part(
         conference_call_structured_dict["presentation"],
         corp_participants_collapsed,
         conf_participants_collapsed,
         type="presentation",
     )
     # Q&A
-    qa = extract_info_from_earnings_call_part(
+    qa, qa_collapsed = _extract_info_from_earnings_call_part(
         conference_call_structured_dict["qa"],
         corp_participants_collapsed,
         conf_participants_collapsed,
@@ -605,7 +685,9 @@ def extract_info_from_earnings_call_structured(
         "conf_participants": conf_participants,
         "conf_participants_collapsed": conf_participants_collapsed,
         "presentation": presentation,
+        "presentation_collapsed": presentation_collapsed,
         "qa": qa,
+        "qa_collapsed": qa_collapsed,
     }
     return output
 
@@ -646,14 +728,92 @@ def extract_info_from_earnings_call_body(body: str) -> dict:
               participants with collapsed name and position.
             - 'presentation': list[dict] - Presentation part of the earnings
               call as returned by :func:`extract_info_from_earnings_call_part`.
+            - 'presentation_collapsed': str - Texts of the corporate
+              participants in the presentation, joined into a single string.
             - 'qa': list[dict] - Q&A part of the earnings call as returned by
               :func:`extract_info_from_earnings_call_part`.
+            - 'qa_collapsed': str - Texts of the corporate participants in
+              the Q&A, joined into a single string.
     """
     conference_call_structured_raw = structure_earnings_call(body)
     output = extract_info_from_earnings_call_structured(conference_call_structured_raw)
     return output
 
 
+def _digits(text: str, min_length: int = 1, max_length: int = 2) -> int:
+    """Converts `text` to int, if it consists of the given number of digits."""
+    if not min_length <= len(text) <= max_length or not text.isdigit():
+        raise ValueError(f"Invalid number: {text}")
+    return int(text)
+
+
+def _hour_24(hour: str, period: str) -> int:
+    """Converts a 12-hour clock `hour` and its `period` (AM/PM) to 24 hours."""
+    hour = _digits(hour)
+    if not 1 <= hour <= 12 or period not in ("AM", "PM"):
+        raise ValueError(f"Invalid 12-hour clock time: {hour}{period}")
+    return hour % 12 + (12 if period == "PM" else 0)
+
+
+def parse_start_date(text: str) -> datetime:
+    """
+    Parses the start date of an earnings call, e.g. '07-Nov-23 4:00PM GMT',
+    given in the format '%d-%b-%y %I:%M%p %Z'.
+
+    Splits the fixed format by hand, which is considerably faster than
+    :func:`datetime.strptime`. Falls back to the latter for any other input.
+    """
+    try:
+        date, time, timezone = text.split(" ")
+        day, month, year = date.split("-")
+        hour, minute = time[:-2].split(":")
+        if timezone not in _TIMEZONES:
+            raise ValueError(f"Unexpected start date: {text}")
+        year = _digits(year, 2, 2)
+        year += 1900 if year >= 69 else 2000  # as %y
+        return datetime(
+            year,
+            _MONTHS_ABBR[month],
+            _digits(day),
+            _hour_24(hour, time[-2:]),
+            _digits(minute),
+        )
+    except (KeyError, ValueError):
+        return datetime.strptime(text, "%d-%b-%y %I:%M%p %Z")
+
+
+def parse_last_update(text: str) -> datetime:
+    """
+    Parses the last update of an earnings call, e.g. 'Tuesday, November 07,
+    2023 at 4:00:00PM GMT', given in the format
+    '%A, %B %d, %Y at %I:%M:%S%p %Z'.
+
+    Splits the fixed format by hand, which is considerably faster than
+    :func:`datetime.strptime`. Falls back to the latter for any other input.
+    """
+    try:
+        weekday, month, day, year, at, time, timezone = text.split(" ")
+        hour, minute, second = time[:-2].split(":")
+        if (
+            weekday[:-1] not in _WEEKDAYS
+            or not weekday.endswith(",")
+            or not day.endswith(",")
+            or at != "at"
+            or timezone not in _TIMEZONES
+        ):
+            raise ValueError(f"Unexpected last update: {text}")
+        return datetime(
+            _digits(year, 4, 4),
+            _MONTHS[month],
+            _digits(day[:-1]),
+            _hour_24(hour, time[-2:]),
+            _digits(minute),
+            _digits(second),
+        )
+    except (KeyError, ValueError):
+        return datetime.strptime(text, "%A, %B %d, %Y at %I:%M:%S%p %Z")
+
+
 def create_blank_event() -> dict:
     """
     Creates a blank event with the keys that are expected in the final output.
@@ -665,35 +825,80 @@ def create_blank_event() -> dict:
     dict
         Dictionary containing the blank event.
     """
-    event = {}
-    event["file"] = ""
-    event["year_upload"] = ""
-    # event["body_orig"] = ""
-    event["corp_participants"] = []
-    event["corp_participants_collapsed"] = []
-    event["conf_participants"] = []
-    event["conf_participants_collapsed"] = []
-    event["presentation"] = []
-    event["presentation_collapsed"] = ""
-    event["qa"] = []
-    event["qa_collapsed"] = ""
-    event["action"] = "unknown"
-    event["story_type"] = "unknown"
-    event["version"] = "unknown"
-    event["title"] = "unknown"
-    event["city"] = "unknown"
-    event["company_name"] = "unknown"
-    event["company_ticker"] = "unknown"
-    event["date"] = datetime(1900, 1, 1)
-    event["id"] = int(-1)
-    event["last_update"] = datetime(1900, 1, 1)
-    event["event_type_id"] = int(-1)
-    event["event_type_name"] = "unknown"
+    event = _BLANK_EVENT.copy()
+    for key in _BLANK_EVENT_LISTS:
+        event[key] = []
 
     return event
 
 
-def add_info_to_event(event: dict, element) -> dict:  # noqa: C901
+def _intern(text: str | None) -> str | None:
+    """Interns `text`, which repeats across events, e.g. company names."""
+    return text if text is None else sys.intern(text)
+
+
+def _add_body(event: dict, element) -> None:
+    event.update(extract_info_from_earnings_call_body(element.text))
+
+
+def _add_event_story(event: dict, element) -> None:
+    event["action"] = _intern(element.attrib["action"])
+    event["story_type"] = _intern(element.attrib["storyType"])
+    event["version"] = _intern(element.attrib["version"])
+
+
+def _add_title(event: dict, element) -> None:
+    event["title"] = element.text
+
+
+def _add_city(event: dict, element) -> None:
+    event["city"] = _intern(element.text)
+
+
+def _add_company_name(event: dict, element) -> None:
+    event["company_name"] = _intern(element.text)
+
+
+def _add_company_ticker(event: dict, element) -> None:
+    event["company_ticker"] = _intern(element.text)
+
+
+def _add_start_date(event: dict, element) -> None:
+    event["date"] = parse_start_date(element.text)
+
+
+def _add_event(event: dict, element) -> None:
+    event["id"] = int(element.attrib["Id"])
+    event["last_update"] = parse_last_update(element.attrib["lastUpdate"])
+    event["event_type_id"] = int(element.attrib["eventTypeId"])
+    event["event_type_name"] = _intern(element.attrib["eventTypeName"])
+
+
+# xml tags that hold information of the event and their handlers
+_TAG_HANDLERS = {
+    "Body": _add_body,
+    "EventStory": _add_event_story,
+    "eventTitle": _add_title,
+    "city": _add_city,
+    "companyName": _add_company_name,
+    "companyTicker": _add_company_ticker,
+    "startDate": _add_start_date,
+    "Event": _add_event,
+}
+_EVENT_TAGS = tuple(_TAG_HANDLERS)
+# metadata of the event that is interned by the handlers
+_INTERNED_KEYS = (
+    "action",
+    "story_type",
+    "version",
+    "city",
+    "company_name",
+    "company_ticker",
+    "event_type_name",
+)
+
+
+def add_info_to_event(event: dict, element) -> dict:
     """
     Adds information to given `event` based on the `element` of an xml file.
     Used by :func:`load_files_from_xml`.
@@ -710,65 +915,192 @@ def add_info_to_event(event: dict, element) -> dict:  # noqa: C901
     dict
         Dictionary containing the event with the added information.
     """
-    tag = element.tag
-    if tag is None:
-        return event
+    handler = _TAG_HANDLERS.get(element.tag)
+    if handler is not None:
+        handler(event, element)
 
-    text = element.text
-    if tag == "Body":
-        # event["body_orig"] = text
+    return event
 
-        body = extract_info_from_earnings_call_body(text)
 
-        event["corp_participants"] = body["corp_participants"]
-        event["corp_participants_collapsed"] = body["corp_participants_collapsed"]
-        event["conf_participants"] = body["conf_participants"]
-        event["conf_participants_collapsed"] = body["conf_participants_collapsed"]
+def _load_file_from_xml(file, i: int, n_files: int) -> tuple[dict, list[str]]:
+    """
+    Parses a single xml `file` into an event. Returns the event together with
+    the messages of the warnings raised while parsing, as these are logged by
+    the calling process.
+    """
+    load_logger.info("Processing file: %d/%d: %s", i, n_files, file)
+    event = create_blank_event()
+    # event["file"] = Path(file).stem
+    event["file"] = file
+    event["year_upload"] = int(os.path.basename(os.path.dirname(file)))
+
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        context = etree.iterparse(
+            file,
+            events=("end",),
+            tag=_EVENT_TAGS,
+            # nothing below is read, so skip building it (a speed-up only, the
+            # clearing below does not rely on comments or pis being removed)
+            collect_ids=False,
+            remove_blank_text=True,
+            remove_comments=True,
+            remove_pis=True,
+        )
+        for _, elem in context:
+            event = add_info_to_event(event, elem)
 
-        presentation = body["presentation"]
-        event["presentation"] = presentation
-        if presentation:
-            event["presentation_collapsed"] = " ".join(
-                [el["text"] for el in presentation if el["position"] == "cooperation"]
-            )
-        else:
-            event["presentation_collapsed"] = ""
+            # free the already processed parts of the tree
+            elem.clear(keep_tail=True)
+            # the root (<Event>) has no parent, even if preceded by a comment
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+        del context
 
-        qa = body["qa"]
-        event["qa"] = qa
-        if qa:
-            event["qa_collapsed"] = " ".join(
-                [el["text"] for el in qa if el["position"] == "cooperation"]
-            )
-        else:
-            event["qa_collapsed"] = ""
-
-    if tag == "EventStory":
-        event["action"] = element.attrib["action"]
-        event["story_type"] = element.attrib["storyType"]
-        event["version"] = element.attrib["version"]
-    if tag == "eventTitle":
-        event["title"] = text
-    if tag == "city":
-        event["city"] = text
-    if tag == "companyName":
-        event["company_name"] = text
-    if tag == "companyTicker":
-        event["company_ticker"] = text
-    if tag == "startDate":
-        event["date"] = datetime.strptime(text, "%d-%b-%y %I:%M%p %Z")
-    if tag == "Event":
-        event["id"] = int(element.attrib["Id"])
-        event["last_update"] = datetime.strptime(
-            element.attrib["lastUpdate"], "%A, %B %d, %Y at %I:%M:%S%p %Z"
-        )
-        event["event_type_id"] = int(element.attrib["eventTypeId"])
-        event["event_type_name"] = element.attrib["eventTypeName"]
+    return event, [f"{file}: {warning.message}" for warning in caught_warnings]
+
+
+def extract_event_from_tree(tree) -> dict:
+    """
+    Extracts the information of an earnings call from an already parsed xml
+    `tree`, so that callers that hold the tree anyway do not need to parse the
+    file a second time. Contrary to :func:`load_files_from_xml` the tree is
+    left intact.
+
+    Parameters
+    ----------
+    tree : lxml.etree._ElementTree or lxml.etree._Element
+        Parsed xml file, e.g. as returned by :func:`lxml.etree.parse`.
+
+    Returns
+    -------
+    dict
+        Dictionary containing the event. Same format as the events of
+        :func:`load_files_from_xml`, except for 'file' and 'year_upload',
+        which are left blank.
+    """
+    event = create_blank_event()
+    for _, elem in etree.iterwalk(tree, events=("end",), tag=_EVENT_TAGS):
+        event = add_info_to_event(event, elem)
 
     return event
 
 
-def load_files_from_xml(files: list) -> list[dict]:
+def _init_worker(log_queue) -> None:
+    """
+    Sends the log records of a worker process through `log_queue` to the
+    calling process, so that only the latter writes to the log file.
+    """
+    for handler in load_logger.handlers[:]:
+        load_logger.removeHandler(handler)
+        handler.close()
+    load_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def _intern_event(event: dict) -> dict:
+    """
+    Interns the metadata and the participants' names and positions of an
+    `event` again. Events that come back from another process are unpickled
+    with fresh strings, that are only shared within the chunk of events they
+    were sent with.
+    """
+    for key in _INTERNED_KEYS:
+        event[key] = _intern(event[key])
+    for part in ("presentation", "qa"):
+        for participant in event[part] or ():
+            participant["name"] = sys.intern(participant["name"])
+            participant["position"] = sys.intern(participant["position"])
+    return event
+
+
+def _iter_events(results, n_files: int, intern: bool = False) -> Iterator[dict]:
+    """
+    Yields the events of :func:`_load_file_from_xml` and logs warnings. With
+    `intern`, the events are interned again (see :func:`_intern_event`).
+    """
+    for event, warning_messages in tqdm(results, desc="Files", total=n_files):
+        for warning_message in warning_messages:
+            load_warnings_logger.warning(warning_message)
+        yield _intern_event(event) if intern else event
+
+
+def _n_workers(n_process: int) -> int:
+    """
+    Validates `n_process` and returns the number of processes to parse with.
+    """
+    if n_process == -1:
+        # cpu_count() is None if the number of CPUs cannot be determined
+        return os.cpu_count() or 1
+    if n_process < 1:
+        raise ValueError(f"n_process must be -1 or at least 1, got {n_process}")
+    return n_process
+
+
+def iter_files_from_xml(files: list, n_process: int = 1) -> Iterator[dict]:
+    """
+    Parses the xml files and yields the extracted information of the earnings
+    calls one event at a time, in the order of `files`. Unlike
+    :func:`load_files_from_xml`, the events need not be held in memory all at
+    once. With several processes, finished events may be buffered until they
+    are consumed.
+
+    Parameters
+    ----------
+    files : list
+        List of xml `files`, to be parsed.
+    n_process : int, default: 1
+        Number of processes the `files` are parsed with. -1 uses all available
+        CPUs.
+
+    Yields
+    ------
+    dict
+        Dictionary containing the extracted information from an earnings call,
+        as described in :func:`load_files_from_xml`.
+
+    Raises
+    ------
+    ValueError
+        If `n_process` is neither -1 nor at least 1.
+    """
+    # validated here, as the generator below only starts on the first next()
+    return _iter_files_from_xml(files, _n_workers(n_process))
+
+
+def _iter_files_from_xml(files: list, max_workers: int) -> Iterator[dict]:
+    """Does the work of :func:`iter_files_from_xml`."""
+    n_files = len(files)
+    load_logger.info("Start loading files from xml")
+    load_logger.info("Number of files: %d", n_files)
+    load_logger.info("Start processing files")
+
+    args = (files, range(1, n_files + 1), itertools.repeat(n_files))
+    if max_workers == 1:
+        yield from _iter_events(map(_load_file_from_xml, *args), n_files)
+    else:
+        # hand the files to the processes in chunks to save on IPC, but small
+        # enough that every process gets several of them
+        chunksize = max(1, min(32, n_files // (max_workers * 4)))
+        log_queue = multiprocessing.Queue()
+        log_listener = logging.handlers.QueueListener(log_queue, *load_logger.handlers)
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(log_queue,),
+        )
+        # started only once the executor exists, so that it is always stopped
+        log_listener.start()
+        try:
+            results = executor.map(_load_file_from_xml, *args, chunksize=chunksize)
+            yield from _iter_events(results, n_files, intern=True)
+        finally:
+            # drops the files not yet parsed, if the iteration is stopped early
+            executor.shutdown(cancel_futures=True)
+            log_listener.stop()
+
+
+def load_files_from_xml(files: list, n_process: int = 1) -> list[dict]:
     """
     Parses the xml files and extracts the information from the earnings calls.
 
@@ -776,6 +1108,10 @@ def load_files_from_xml(files: list) -> list[dict]:
     ----------
     files : list
         List of xml `files`, to be parsed.
+    n_process : int, default: 1
+        Number of processes the `files` are parsed with. The files are
+        independent of each other and are distributed among the processes.
+        -1 uses all available CPUs.
 
     Returns
     -------
@@ -806,34 +1142,10 @@ def load_files_from_xml(files: list) -> list[dict]:
             - 'last_update': date - the last update of the publication
             - 'event_type_id': int - the event type id
             - 'event_type_name': str - the event type name
-    """
-    load_logger.info("Start loading files from xml")
-    load_logger.info("Number of files: " + str(len(files)))
-    load_logger.info("Start processing files")
 
-    events = []
-    i = 1
-    for file in tqdm(files, desc="Files", total=len(files)):
-        load_logger.info(
-            "Processing file: " + str(i) + "/" + str(len(files)) + ": " + str(file)
-        )
-        # print(i, "/", len(files), " - Processing file: ", file, end="\r")
-        event = create_blank_event()
-        # event["file"] = Path(file).stem
-        event["file"] = file
-        event["year_upload"] = int(os.path.basename(os.path.dirname(file)))
-
-        for _, elem in etree.iterparse(file):
-            with warnings.catch_warnings(record=True) as caught_warnings:
-                event = add_info_to_event(event, elem)
-
-            if caught_warnings:
-                for warning in caught_warnings:
-                    warning_message = f"{file}: {warning.message}"
-                    load_warnings_logger.warning(warning_message)
-                    # print(f"Warning occurred in {file}: {warning.message}", end="\n")
-
-        events.append(event)
-        i += 1
-
-    return events
+    Raises
+    ------
+    ValueError
+        If `n_process` is neither -1 nor at least 1.
+    """
+    return list(iter_files_from_xml(files, n_process))